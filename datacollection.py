@@ -1,125 +1,247 @@
+import asyncio
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import functools
+from itertools import islice
 import json
 import logging
 import os
-import time
-from typing import Any, Dict, List, Tuple
+import random
+import re
+from typing import Any, Dict, List, Set, Tuple
+from zoneinfo import ZoneInfo
 
-import dateutil.parser
-from ohmysportsfeedspy import MySportsFeeds
-import pytz
+import aiohttp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from const import TOKEN
 
 START_YEAR = 2014
 SLEEP_TIME = 10
+MAX_BACKOFF = 300
+MAX_RETRIES = 6
+MAX_CONCURRENT_REQUESTS = 8
+MAX_READ_WORKERS = 16
 
-msf = MySportsFeeds(version="2.1", store_type=None)
+API_BASE_URL = "https://api.mysportsfeeds.com/v2.1/pull"
 
-msf.authenticate(TOKEN, "MYSPORTSFEEDS")
+EASTERN = ZoneInfo("US/Eastern")
 
-BASE_PARAMS = {"format": "json", "league": "nfl", "force": True}
+BASE_PARAMS = {"format": "json", "league": "nfl", "force": "true"}
 SEASONAL_GAME_FEED = "seasonal_games"
 SEASONAL_FEEDS = ["seasonal_team_stats", "seasonal_player_stats"]
 WEEKLY_GAME_FEED = "weekly_games"
+# The v2.1 detail endpoints behind these feeds address a single game in the
+# URL path, so they cannot be batched into one multi-game request;
+# get_game_feeds overlaps the per-game requests with asyncio.gather instead.
 BY_GAME_FEEDS = ["game_boxscore", "game_playbyplay", "game_lineup"]
 
+FEED_PATHS = {
+    SEASONAL_GAME_FEED: "games",
+    "seasonal_team_stats": "team_stats_totals",
+    "seasonal_player_stats": "player_stats_totals",
+    WEEKLY_GAME_FEED: "week/{week}/games",
+    "game_boxscore": "games/{game}/boxscore",
+    "game_playbyplay": "games/{game}/playbyplay",
+    "game_lineup": "games/{game}/lineup",
+}
+
+AUTH = aiohttp.BasicAuth(TOKEN, "MYSPORTSFEEDS")
+
+semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Day shift (0/+1/-1) of the last game id that resolved, keyed by away team.
+# Most of a team's games land on the same UTC day shift, so trying the hinted
+# shift first avoids the two failed requests of the brute-force fallback.
+date_shift_hints: Dict[str, int] = {}
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+def get_params_key(
+    additional_params: Dict[str, str] = None
+) -> Tuple[Tuple[str, str], ...]:
+    if not additional_params:
+        return None
+
+    return tuple(sorted(additional_params.items()))
+
+
+@functools.lru_cache(maxsize=4096)
 def get_filename(
-    feed: str, season: str, additional_params: Dict[str, str] = None
+    feed: str, season: str, params_key: Tuple[Tuple[str, str], ...] = None
 ) -> str:
-    filename = f"season.{season}--feed.{feed}"
-    if additional_params:
-        for k, v in additional_params.items():
-            filename += f"--{k}.{v}" if k and v else f"--{k}{v}"
+    parts = [f"season.{season}--feed.{feed}"]
+    if params_key:
+        parts.extend(
+            f"--{k}.{v}" if k and v else f"--{k}{v}" for k, v in params_key
+        )
+    parts.append(".json")
+
+    return "".join(parts)
+
+
+def dump_json(data: Any, filename: str) -> None:
+    if orjson:
+        with open(filename, "wb") as fp:
+            fp.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, "w") as fp:
+            json.dump(data, fp, indent=2)
+
+
+def load_json(filename: str) -> Any:
+    if orjson:
+        with open(filename, "rb") as fp:
+            return orjson.loads(fp.read())
+
+    with open(filename, "r") as fp:
+        return json.load(fp)
 
-    return f"{filename}.json"
 
+def get_retry_delay(retry: int, retry_after: str = None) -> float:
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
 
-def get_feeds(
+    return min(MAX_BACKOFF, SLEEP_TIME * pow(2, retry)) * random.uniform(0.5, 1.5)
+
+
+def get_session() -> aiohttp.ClientSession:
+    # Keep connections alive across the backoff sleeps so every request in a
+    # run reuses the same TCP+TLS connections instead of re-handshaking.
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_REQUESTS, keepalive_timeout=MAX_BACKOFF
+    )
+    return aiohttp.ClientSession(auth=AUTH, connector=connector)
+
+
+def get_feed_url(feed: str, params: Dict[str, str]) -> str:
+    path = FEED_PATHS[feed].format(**params)
+    return (
+        f"{API_BASE_URL}/{params['league']}/{params['season']}/{path}"
+        f".{params['format']}"
+    )
+
+
+async def get_feeds(
+    session: aiohttp.ClientSession,
     feeds: List[str],
     season: str,
+    existing: Set[str],
     additional_params: Dict[str, str] = None,
     additional_params_to_try: List[Dict[str, str]] = None,
 ) -> List[Dict[str, str]]:
     errors = []
-    params = BASE_PARAMS.copy()
-    params["season"] = season
-    if additional_params:
-        params.update(additional_params)
 
     for feed in feeds:
-        params["feed"] = feed
+        params = ChainMap(
+            additional_params or {}, {"feed": feed, "season": season}, BASE_PARAMS
+        )
 
-        json_file = get_filename(feed, season, additional_params)
+        json_file = get_filename(feed, season, get_params_key(additional_params))
 
         if additional_params:
             desc = f"{feed} for {' for '.join(additional_params.values())} for {season}"
         else:
             desc = f"{feed} for {season}"
 
-        if not os.path.isfile(json_file):
-            logger.warning(f"Starting download of {desc}")
-            logger.warning(f"Params: {params}")
+        if json_file not in existing:
+            logger.warning("Starting download of %s", desc)
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Params: %s", dict(params))
+            url = get_feed_url(feed, params)
+            data = None
+            downloaded = False
             retry = 1
             while retry > 0:
-                try:
-                    data = msf.msf_get_data(**params)
-                    data.pop("lastUpdatedOn")
-                    retry = 0
-                except Warning as e:
-                    status = int(str(e)[-3:])
-                    if status in [429, 499, 502, 503]:
+                async with semaphore:
+                    async with session.get(
+                        url, params={"force": params["force"]}
+                    ) as resp:
+                        status = resp.status
+                        retry_after = resp.headers.get("Retry-After")
+                        if status == 200:
+                            data = await resp.json()
+                            data.pop("lastUpdatedOn")
+                            retry = 0
+                        elif status not in [429, 499, 502, 503, 400, 403]:
+                            resp.raise_for_status()
+                if status in [429, 499, 502, 503]:
+                    if retry > MAX_RETRIES:
                         logger.warning(
-                            f"Attempt {retry} failed, sleeping for {SLEEP_TIME * pow(retry, 2)} seconds"
+                            "Attempt %s failed, giving up on download of %s",
+                            retry,
+                            desc,
                         )
-                        time.sleep(SLEEP_TIME * pow(retry, 2))
+                        retry = -1
+                    else:
+                        delay = get_retry_delay(retry, retry_after)
+                        logger.warning(
+                            "Attempt %s failed, sleeping for %.1f seconds",
+                            retry,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
                         retry += 1
-                    elif status == 400:
-                        if additional_params_to_try:
-                            for try_params in additional_params_to_try:
-                                logger.warning(
-                                    f"Malformed request. Trying download of {desc} using alternate params {try_params}"
-                                )
-                                if not get_feeds([feed], season, try_params):
-                                    retry = 0
-                                    break
-                                else:
-                                    retry = -1
-                        else:
+                elif status == 400:
+                    if additional_params_to_try:
+                        for try_params in additional_params_to_try:
                             logger.warning(
-                                f"Malformed request. Skip download of {desc}"
+                                "Malformed request. Trying download of %s using alternate params %s",
+                                desc,
+                                try_params,
                             )
-                            retry = -1
-                    elif status == 403:
-                        logger.warning(f"Unauthorized request. Skip download of {desc}")
-                        retry = -1
+                            if not await get_feeds(session, [feed], season, existing, try_params):
+                                downloaded = True
+                                retry = 0
+                                break
+                            else:
+                                retry = -1
                     else:
-                        raise e
-            if retry == -1 or not data:
-                errors.append({**params.copy(), "error": status})
-            else:
-                with open(json_file, "w") as fp:
-                    json.dump(data, fp, indent=2)
-            logger.warning(f"Finished downloading {desc}")
+                        logger.warning("Malformed request. Skip download of %s", desc)
+                        retry = -1
+                elif status == 403:
+                    logger.warning("Unauthorized request. Skip download of %s", desc)
+                    retry = -1
+                elif status != 200:
+                    # raise_for_status is a no-op below 400, so an unhandled
+                    # 2xx/3xx would otherwise loop forever re-issuing the
+                    # same request.
+                    logger.warning(
+                        "Unexpected status %s. Skip download of %s", status, desc
+                    )
+                    retry = -1
+            if retry == -1 or (not data and not downloaded):
+                errors.append({**params, "error": status})
+            elif data:
+                dump_json(data, json_file)
+                existing.add(json_file)
+            logger.warning("Finished downloading %s", desc)
         else:
-            logger.warning(f"Skipping download of {desc}")
+            logger.warning("Skipping download of %s", desc)
 
     return errors
 
 
-def get_game_ids(game: Dict[str, Any]) -> Tuple[str, str, str]:
-    game_date_raw = dateutil.parser.isoparse(game["schedule"]["startTime"]).astimezone(
-        pytz.timezone("US/Eastern")
+@functools.lru_cache(maxsize=4096)
+def build_game_ids(
+    start_time: str, game_away_team: str, game_home_team: str
+) -> Tuple[str, str, str]:
+    game_date_raw = datetime.fromisoformat(start_time.replace("Z", "+00:00")).astimezone(
+        EASTERN
     )
     game_date = game_date_raw.strftime("%Y%m%d")
     plusone_game_date = (game_date_raw + timedelta(days=1)).strftime("%Y%m%d")
     minusone_game_date = (game_date_raw - timedelta(days=1)).strftime("%Y%m%d")
-    game_away_team = game["schedule"]["awayTeam"]["abbreviation"]
-    game_home_team = game["schedule"]["homeTeam"]["abbreviation"]
     return (
         f"{game_date}-{game_away_team}-{game_home_team}",
         f"{plusone_game_date}-{game_away_team}-{game_home_team}",
@@ -127,178 +249,277 @@ def get_game_ids(game: Dict[str, Any]) -> Tuple[str, str, str]:
     )
 
 
-def get_game_file(feed: str, season: str, game: Dict[str, Any]) -> str:
+def get_game_ids(game: Dict[str, Any]) -> Tuple[str, str, str]:
+    schedule = game["schedule"]
+    return build_game_ids(
+        schedule["startTime"],
+        schedule["awayTeam"]["abbreviation"],
+        schedule["homeTeam"]["abbreviation"],
+    )
+
+
+def get_game_file(
+    feed: str, season: str, game: Dict[str, Any], existing: Set[str]
+) -> str:
     (game_id, plusone_game_id, minusone_game_id) = get_game_ids(game)
-    game_file = get_filename(feed, season, {"game": game_id})
-    plusone_game_file = get_filename(feed, season, {"game": plusone_game_id})
-    minusone_game_file = get_filename(feed, season, {"game": minusone_game_id})
-    if os.path.isfile(game_file):
+    game_file = get_filename(feed, season, get_params_key({"game": game_id}))
+    plusone_game_file = get_filename(
+        feed, season, get_params_key({"game": plusone_game_id})
+    )
+    minusone_game_file = get_filename(
+        feed, season, get_params_key({"game": minusone_game_id})
+    )
+    if game_file in existing:
         return game_file
-    elif os.path.isfile(plusone_game_file):
+    elif plusone_game_file in existing:
         return plusone_game_file
     else:
         return minusone_game_file
 
 
-def delete_weekly_feeds_for_season(season: str) -> None:
-    week_feeds_to_delete = []
-    for filename in os.listdir("."):
-        if "--week." in filename and f"season.{season}" in filename:
-            week_feeds_to_delete += filename
+def read_game_file(game_file: str) -> bytes:
+    with open(game_file, "rb") as fp:
+        return fp.read().strip()
 
-    if week_feeds_to_delete:
-        logger.warning(f"Deleting all weekly feeds for {season} season")
-        for filename in week_feeds_to_delete:
-            os.remove(filename)
-        logger.warning(f"Done deleting all weekly feeds for {season} season")
 
+def generate_feed_file(
+    feed: str,
+    season: str,
+    games: List[Dict[str, Any]],
+    feed_file: str,
+    existing: Set[str],
+) -> None:
+    if feed_file in existing:
+        os.remove(feed_file)
+
+    # Resolve every game's filename once up front; get_game_file probes up to
+    # three candidate names per call.
+    game_files = [get_game_file(feed, season, game, existing) for game in games]
+
+    first = True
+    files_iter = iter(game_files)
+    with open(feed_file, "wb") as fp, ThreadPoolExecutor(
+        max_workers=MAX_READ_WORKERS
+    ) as executor:
+        fp.write(b"[\n")
+        # Read in bounded chunks so the threads overlap disk I/O without
+        # holding more than one chunk of games in memory at a time.
+        while chunk := list(islice(files_iter, MAX_READ_WORKERS)):
+            for raw in executor.map(read_game_file, chunk):
+                if not first:
+                    fp.write(b",\n")
+                fp.write(raw)
+                first = False
+        fp.write(b"\n]\n")
+
+    existing.add(feed_file)
+
+
+async def get_game_feed(
+    session: aiohttp.ClientSession,
+    feed: str,
+    season: str,
+    game: Dict[str, Any],
+    existing: Set[str],
+) -> List[Dict[str, str]]:
+    game_ids = dict(zip((0, 1, -1), get_game_ids(game)))
+    away_team = game["schedule"]["awayTeam"]["abbreviation"]
+    hint = date_shift_hints.get(away_team, 0)
+    shifts = [hint] + [shift for shift in (0, 1, -1) if shift != hint]
+
+    errors = await get_feeds(
+        session,
+        [feed],
+        season,
+        existing,
+        {"game": game_ids[shifts[0]]},
+        [{"game": game_ids[shift]} for shift in shifts[1:]],
+    )
 
-def delete_games_for_season_and_feed(season: str, feed: str) -> None:
-    game_feeds_to_delete = []
-    for filename in os.listdir("."):
-        if (
-            "--game." in filename
-            and f"season.{season}" in filename
-            and f"feed.{feed}" in filename
-        ):
-            game_feeds_to_delete += filename
+    if not errors:
+        for shift in shifts:
+            game_file = get_filename(
+                feed, season, get_params_key({"game": game_ids[shift]})
+            )
+            if game_file in existing:
+                date_shift_hints[away_team] = shift
+                break
 
-    if game_feeds_to_delete:
-        logger.warning(f"Deleting all {feed} game feeds for {season} season")
-        for filename in game_feeds_to_delete:
-            os.remove(filename)
-        logger.warning(f"Done deleting all {feed} game feeds for {season} season")
+    return errors
 
 
-def get_full_season_data(start_year: int = START_YEAR) -> None:
-    now = datetime.today()
-    next_full_season_start_year = now.year if now.month > 2 else now.year - 1
+async def get_game_feeds(
+    session: aiohttp.ClientSession,
+    feed: str,
+    season: str,
+    games: List[Dict[str, Any]],
+    existing: Set[str],
+) -> List[Dict[str, str]]:
+    tasks = [
+        get_game_feed(session, feed, season, game, existing) for game in games
+    ]
 
-    for year in range(start_year, next_full_season_start_year):
-        season = f"{year}-{year + 1}-regular"
-        logger.warning(f"Downloading data for {season} season")
-        if not get_feeds(SEASONAL_FEEDS + [SEASONAL_GAME_FEED], season):
-            for feed in BY_GAME_FEEDS:
-                feed_file = get_filename(feed, season)
-                if not os.path.isfile(feed_file):
-                    logger.warning(f"Downloading {feed} game feeds for {season} season")
-                    with open(get_filename(SEASONAL_GAME_FEED, season), "r") as fp:
-                        games = json.load(fp)["games"]
-                    errors = []
-                    for game in games:
-                        (game_id, plusone_game_id, minusone_game_id) = get_game_ids(
-                            game
-                        )
-                        errors += get_feeds(
-                            [feed],
-                            season,
-                            {"game": game_id},
-                            [{"game": plusone_game_id}, {"game": minusone_game_id}],
-                        )
+    errors = []
+    for result in await asyncio.gather(*tasks):
+        errors += result
 
-                    if not errors:
-                        logger.warning(
-                            f"Retrieved all {feed} game feeds for {season} season"
-                        )
-                        logger.warning(f"Generating {feed_file}")
-                        data_list = []
-                        for game in games:
-                            with open(get_game_file(feed, season, game), "r") as fp:
-                                game_dict = json.load(fp)
+    return errors
 
-                            data_list.append(game_dict)
 
-                        if os.path.isfile(feed_file):
-                            os.remove(feed_file)
+def cleanup_season(season: str, feeds: List[str], existing: Set[str]) -> None:
+    pattern = re.compile(
+        rf"season\.{re.escape(season)}--feed\.(?P<feed>[^-]+)--(?P<kind>game|week)\."
+    )
+    feeds_to_delete = []
+    for filename in existing:
+        match = pattern.search(filename)
+        if match and (match.group("kind") == "week" or match.group("feed") in feeds):
+            feeds_to_delete.append(filename)
+
+    if feeds_to_delete:
+        logger.warning(
+            "Deleting all %s game feeds and weekly feeds for %s season", feeds, season
+        )
+        for filename in feeds_to_delete:
+            os.remove(filename)
+            existing.discard(filename)
+        logger.warning(
+            "Done deleting all %s game feeds and weekly feeds for %s season",
+            feeds,
+            season,
+        )
+
+
+async def get_season_data(
+    session: aiohttp.ClientSession, season: str, existing: Set[str]
+) -> None:
+    logger.warning("Downloading data for %s season", season)
+    if not await get_feeds(
+        session, SEASONAL_FEEDS + [SEASONAL_GAME_FEED], season, existing
+    ):
+        for feed in BY_GAME_FEEDS:
+            feed_file = get_filename(feed, season)
+            if feed_file not in existing:
+                logger.warning("Downloading %s game feeds for %s season", feed, season)
+                games = load_json(get_filename(SEASONAL_GAME_FEED, season))["games"]
+                errors = await get_game_feeds(session, feed, season, games, existing)
 
-                        with open(feed_file, "w") as fp:
-                            json.dump(data_list, fp, indent=2)
-                        logger.warning(f"Done generating {feed_file}")
+                if not errors:
+                    logger.warning(
+                        "Retrieved all %s game feeds for %s season", feed, season
+                    )
+                    logger.warning("Generating %s", feed_file)
+                    generate_feed_file(feed, season, games, feed_file, existing)
+                    logger.warning("Done generating %s", feed_file)
 
-                        delete_games_for_season_and_feed(season, feed)
-                        delete_weekly_feeds_for_season(season)
+                    cleanup_season(season, [feed], existing)
 
-                    else:
-                        error_file = get_filename(feed, season, {"errors": ""})
-                        if os.path.isfile(error_file):
-                            os.remove(error_file)
-                        with open(error_file, "w") as fp:
-                            json.dump(errors, fp, indent=2)
-                        logger.warning(
-                            f"Could not download all {feed} game feeds for {season} season, dumped error list to {error_file}"
-                        )
                 else:
+                    error_file = get_filename(
+                        feed, season, get_params_key({"errors": ""})
+                    )
+                    if error_file in existing:
+                        os.remove(error_file)
+                    dump_json(errors, error_file)
+                    existing.add(error_file)
                     logger.warning(
-                        f"Skipping download of {feed} game feeds for {season} season since {feed_file} exists"
+                        "Could not download all %s game feeds for %s season, dumped error list to %s",
+                        feed,
+                        season,
+                        error_file,
                     )
-        else:
-            logger.warning(f"Could not download all seasonal data for {season} season")
+            else:
+                logger.warning(
+                    "Skipping download of %s game feeds for %s season since %s exists",
+                    feed,
+                    season,
+                    feed_file,
+                )
+    else:
+        logger.warning("Could not download all seasonal data for %s season", season)
 
 
-def get_data_for_week(week: int, season_start_year: int = None) -> None:
+async def get_full_season_data(start_year: int = START_YEAR) -> None:
+    now = datetime.today()
+    next_full_season_start_year = now.year if now.month > 2 else now.year - 1
+
+    existing = {entry.name for entry in os.scandir(".")}
+
+    async with get_session() as session:
+        await asyncio.gather(
+            *[
+                get_season_data(session, f"{year}-{year + 1}-regular", existing)
+                for year in range(start_year, next_full_season_start_year)
+            ]
+        )
+
+
+async def get_data_for_week(week: int, season_start_year: int = None) -> None:
     week = str(week)
     if not season_start_year:
         now = datetime.today()
         season_start_year = now.year if now.month > 8 else now.year - 1
 
     season = f"{season_start_year}-{season_start_year + 1}-regular"
-    logger.warning(f"Downloading data for week {week} of {season} season")
-    if not get_feeds([WEEKLY_GAME_FEED], season, {"week": week}):
-        for feed in BY_GAME_FEEDS:
-            feed_file = get_filename(feed, season, {"week": week})
-            if not os.path.isfile(feed_file):
-                logger.warning(
-                    f"Downloading {feed} game feeds for week {week} of {season} season"
-                )
-                with open(
-                    get_filename(WEEKLY_GAME_FEED, season, {"week": week}), "r"
-                ) as fp:
-                    games = json.load(fp)["games"]
-                errors = []
-                for game in games:
-                    (game_id, plusone_game_id, minusone_game_id) = get_game_ids(game)
-                    errors += get_feeds(
-                        [feed],
-                        season,
-                        {"game": game_id},
-                        [{"game": plusone_game_id}, {"game": minusone_game_id}],
-                    )
+    logger.warning("Downloading data for week %s of %s season", week, season)
+    existing = {entry.name for entry in os.scandir(".")}
 
-                if not errors:
+    async with get_session() as session:
+        if not await get_feeds(
+            session, [WEEKLY_GAME_FEED], season, existing, {"week": week}
+        ):
+            for feed in BY_GAME_FEEDS:
+                feed_file = get_filename(feed, season, get_params_key({"week": week}))
+                if feed_file not in existing:
                     logger.warning(
-                        f"Retrieved all {feed} game feeds for week {week} of {season} season"
+                        "Downloading %s game feeds for week %s of %s season",
+                        feed,
+                        week,
+                        season,
                     )
-                    logger.warning(f"Generating {feed_file}")
-                    data_list = []
-                    for game in games:
-                        with open(get_game_file(feed, season, game), "r") as fp:
-                            game_dict = json.load(fp)
-
-                        data_list.append(game_dict)
-
-                    if os.path.isfile(feed_file):
-                        os.remove(feed_file)
+                    games = load_json(
+                        get_filename(
+                            WEEKLY_GAME_FEED, season, get_params_key({"week": week})
+                        )
+                    )["games"]
+                    errors = await get_game_feeds(session, feed, season, games, existing)
 
-                    with open(feed_file, "w") as fp:
-                        json.dump(data_list, fp, indent=2)
-                    logger.warning(f"Done generating {feed_file}")
+                    if not errors:
+                        logger.warning(
+                            "Retrieved all %s game feeds for week %s of %s season",
+                            feed,
+                            week,
+                            season,
+                        )
+                        logger.warning("Generating %s", feed_file)
+                        generate_feed_file(feed, season, games, feed_file, existing)
+                        logger.warning("Done generating %s", feed_file)
+                    else:
+                        error_file = get_filename(
+                            feed, season, get_params_key({"week": week, "errors": ""})
+                        )
+                        if error_file in existing:
+                            os.remove(error_file)
+                        dump_json(errors, error_file)
+                        existing.add(error_file)
+                        logger.warning(
+                            "Could not download all %s game feeds for week %s of %s season, dumped error list to %s",
+                            feed,
+                            week,
+                            season,
+                            error_file,
+                        )
                 else:
-                    error_file = get_filename(
-                        feed, season, {"week": week, "errors": ""}
-                    )
-                    if os.path.isfile(error_file):
-                        os.remove(error_file)
-                    with open(error_file, "w") as fp:
-                        json.dump(errors, fp, indent=2)
                     logger.warning(
-                        f"Could not download all {feed} game feeds for week {week} of {season} season, dumped error list to {error_file}"
+                        "Skipping download of %s game feeds for week %s of %s season since %s exists",
+                        feed,
+                        week,
+                        season,
+                        feed_file,
                     )
-            else:
-                logger.warning(
-                    f"Skipping download of {feed} game feeds for week {week} of {season} season since {feed_file} exists"
-                )
-    else:
-        logger.warning(f"Could not download all data for week {week} {season} season")
+        else:
+            logger.warning("Could not download all data for week %s %s season", week, season)
 
 
-get_full_season_data()
+if __name__ == "__main__":
+    asyncio.run(get_full_season_data())